@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 """
 Game Theory Quiz - GUI Study Program
-Presents 50 randomized multiple-choice questions per session
-with immediate feedback and score tracking.
+Presents a configurable number of randomized multiple-choice questions
+per session, with an optional timed exam mode, immediate feedback and
+score tracking.
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import math
 import random
+import time
 
 
 # ============================================================================
@@ -20,19 +23,28 @@ QUESTION_BANK = [
         "question": "In a game, if one strategy always provides a higher payoff regardless of what the opponent does, it is called:",
         "options": ["Nash equilibrium", "Dominant strategy", "Best response", "Mixed strategy"],
         "correct_answer": "Dominant strategy",
-        "explanation": "A dominant strategy always yields the highest payoff no matter what opponents do."
+        "explanation": "A dominant strategy always yields the highest payoff no matter what opponents do.",
+        "topic": "Dominant Strategies",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "A strategy that is always worse than some other strategy is called:",
         "options": ["Dominant strategy", "Nash equilibrium", "Dominated strategy", "Mixed strategy"],
         "correct_answer": "Dominated strategy",
-        "explanation": "A dominated strategy should never be played rationally."
+        "explanation": "A dominated strategy should never be played rationally.",
+        "topic": "Dominant Strategies",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "If both players have dominant strategies in a two-player game, the outcome is:",
         "options": ["Not necessarily a Nash equilibrium", "Always Pareto efficient", "Always a Nash equilibrium", "Never stable"],
         "correct_answer": "Always a Nash equilibrium",
-        "explanation": "When both players play dominant strategies, neither can improve by deviating."
+        "explanation": "When both players play dominant strategies, neither can improve by deviating.",
+        "topic": "Dominant Strategies",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
 
     # === Nash Equilibrium ===
@@ -40,19 +52,28 @@ QUESTION_BANK = [
         "question": "In a 2x2 payoff matrix, a pure strategy Nash equilibrium occurs when:",
         "options": ["Both players choose random strategies", "Each player's strategy is a best response to the other's", "Both players have dominant strategies", "The game is zero-sum"],
         "correct_answer": "Each player's strategy is a best response to the other's",
-        "explanation": "Nash equilibrium requires mutual best responses."
+        "explanation": "Nash equilibrium requires mutual best responses.",
+        "topic": "Nash Equilibrium",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "A game can have:",
         "options": ["Exactly one Nash equilibrium", "At most one Nash equilibrium", "Multiple Nash equilibria", "No Nash equilibria in pure strategies only"],
         "correct_answer": "Multiple Nash equilibria",
-        "explanation": "Games can have zero, one, or multiple Nash equilibria."
+        "explanation": "Games can have zero, one, or multiple Nash equilibria.",
+        "topic": "Nash Equilibrium",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "In a Nash equilibrium, which statement is true?",
         "options": ["All players maximize joint payoff", "No player can unilaterally improve their payoff", "All players receive equal payoffs", "The outcome is always Pareto optimal"],
         "correct_answer": "No player can unilaterally improve their payoff",
-        "explanation": "Nash equilibrium is stable because no single player benefits from deviating alone."
+        "explanation": "Nash equilibrium is stable because no single player benefits from deviating alone.",
+        "topic": "Nash Equilibrium",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
 
     # === Mixed Strategies ===
@@ -60,19 +81,28 @@ QUESTION_BANK = [
         "question": "A mixed strategy is defined as:",
         "options": ["A randomization over pure strategies", "A guaranteed win condition", "A strategy that minimizes losses", "The same as a dominant strategy"],
         "correct_answer": "A randomization over pure strategies",
-        "explanation": "Mixed strategies assign probabilities to pure strategies."
+        "explanation": "Mixed strategies assign probabilities to pure strategies.",
+        "topic": "Mixed Strategies",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "In a mixed strategy Nash equilibrium, a player must be:",
         "options": ["Maximizing expected payoff", "Indifferent between pure strategies played with positive probability", "Playing all strategies equally", "Guaranteeing a win"],
         "correct_answer": "Indifferent between pure strategies played with positive probability",
-        "explanation": "If not indifferent, the player would strictly prefer one pure strategy."
+        "explanation": "If not indifferent, the player would strictly prefer one pure strategy.",
+        "topic": "Mixed Strategies",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "Every finite game has:",
         "options": ["At least one pure strategy Nash equilibrium", "At least one Nash equilibrium in pure or mixed strategies", "Exactly one Nash equilibrium", "No dominated strategies"],
         "correct_answer": "At least one Nash equilibrium in pure or mixed strategies",
-        "explanation": "Nash's theorem guarantees existence of equilibrium (possibly mixed)."
+        "explanation": "Nash's theorem guarantees existence of equilibrium (possibly mixed).",
+        "topic": "Mixed Strategies",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
 
     # === Best Responses ===
@@ -80,13 +110,19 @@ QUESTION_BANK = [
         "question": "A best response is a strategy that:",
         "options": ["Always wins the game", "Maximizes a player's payoff given opponents' strategies", "Guarantees a Nash equilibrium", "Is the same for all players"],
         "correct_answer": "Maximizes a player's payoff given opponents' strategies",
-        "explanation": "Best response optimizes against what others are doing."
+        "explanation": "Best response optimizes against what others are doing.",
+        "topic": "Best Responses",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "If a strategy is never a best response to any opponent strategy, it is:",
         "options": ["A dominant strategy", "A Nash equilibrium strategy", "A strictly dominated strategy", "A mixed strategy"],
         "correct_answer": "A strictly dominated strategy",
-        "explanation": "Such strategies should be eliminated from consideration."
+        "explanation": "Such strategies should be eliminated from consideration.",
+        "topic": "Best Responses",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
 
     # === Expected Utility and Payoffs ===
@@ -94,19 +130,28 @@ QUESTION_BANK = [
         "question": "If a player values a 50% chance at $10 and a 50% chance at $0 as $4, their expected utility is:",
         "options": ["4", "5", "10", "2"],
         "correct_answer": "4",
-        "explanation": "The player's subjective value (certainty equivalent) is $4."
+        "explanation": "The player's subjective value (certainty equivalent) is $4.",
+        "topic": "Expected Utility",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "Expected utility theory assumes that players:",
         "options": ["Always prefer certain outcomes", "Maximize expected payoff values", "Are risk-neutral", "Choose randomly"],
         "correct_answer": "Maximize expected payoff values",
-        "explanation": "Players maximize the expected value of their utility function."
+        "explanation": "Players maximize the expected value of their utility function.",
+        "topic": "Expected Utility",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "A risk-averse player:",
         "options": ["Prefers gambles to certain outcomes", "Has a concave utility function", "Always chooses mixed strategies", "Is indifferent to probabilities"],
         "correct_answer": "Has a concave utility function",
-        "explanation": "Concave utility reflects diminishing marginal value of money."
+        "explanation": "Concave utility reflects diminishing marginal value of money.",
+        "topic": "Expected Utility",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
 
     # === Zero-Sum and Non-Zero-Sum Games ===
@@ -114,19 +159,28 @@ QUESTION_BANK = [
         "question": "In a zero-sum game:",
         "options": ["Both players can win", "Total payoffs sum to zero", "Both players lose equally", "Only mixed strategies exist"],
         "correct_answer": "Total payoffs sum to zero",
-        "explanation": "One player's gain equals the other's loss."
+        "explanation": "One player's gain equals the other's loss.",
+        "topic": "Zero-Sum Games",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "Which game is typically non-zero-sum?",
         "options": ["Rock-Paper-Scissors", "Matching Pennies", "Prisoner's Dilemma", "Chess"],
         "correct_answer": "Prisoner's Dilemma",
-        "explanation": "In Prisoner's Dilemma, mutual cooperation benefits both players."
+        "explanation": "In Prisoner's Dilemma, mutual cooperation benefits both players.",
+        "topic": "Zero-Sum Games",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "In zero-sum games, the sum of payoffs across all players is:",
         "options": ["Positive", "Negative", "Constant", "Variable"],
         "correct_answer": "Constant",
-        "explanation": "The total is always the same (typically zero)."
+        "explanation": "The total is always the same (typically zero).",
+        "topic": "Zero-Sum Games",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
 
     # === Minimax and Maximin ===
@@ -134,19 +188,28 @@ QUESTION_BANK = [
         "question": "The maximin strategy involves:",
         "options": ["Maximizing the minimum possible payoff", "Minimizing the maximum loss", "Randomizing equally", "Always cooperating"],
         "correct_answer": "Maximizing the minimum possible payoff",
-        "explanation": "Maximin is a conservative strategy ensuring the best worst-case outcome."
+        "explanation": "Maximin is a conservative strategy ensuring the best worst-case outcome.",
+        "topic": "Minimax and Maximin",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "In a zero-sum game, if the maximin equals the minimax value, this value is called:",
         "options": ["Nash equilibrium value", "Value of the game", "Expected payoff", "Dominant strategy value"],
         "correct_answer": "Value of the game",
-        "explanation": "This is the equilibrium value both players can guarantee."
+        "explanation": "This is the equilibrium value both players can guarantee.",
+        "topic": "Minimax and Maximin",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "The minimax theorem applies to:",
         "options": ["All games", "Two-player zero-sum games", "Cooperative games", "Games with incomplete information"],
         "correct_answer": "Two-player zero-sum games",
-        "explanation": "Von Neumann's minimax theorem guarantees a value in two-player zero-sum games."
+        "explanation": "Von Neumann's minimax theorem guarantees a value in two-player zero-sum games.",
+        "topic": "Minimax and Maximin",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
 
     # === Repeated Games ===
@@ -154,25 +217,37 @@ QUESTION_BANK = [
         "question": "Cooperation in repeated Prisoner's Dilemma is possible if:",
         "options": ["Players are short-sighted", "Discount factor is low", "Players value future payoffs", "Payoffs are symmetric"],
         "correct_answer": "Players value future payoffs",
-        "explanation": "High discount factors make future cooperation valuable."
+        "explanation": "High discount factors make future cooperation valuable.",
+        "topic": "Repeated Games",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "The Folk Theorem states that in infinitely repeated games:",
         "options": ["Only one equilibrium exists", "Many outcomes can be supported as equilibria", "Cooperation never occurs", "Players always defect"],
         "correct_answer": "Many outcomes can be supported as equilibria",
-        "explanation": "With sufficient patience, many payoffs can be equilibrium outcomes."
+        "explanation": "With sufficient patience, many payoffs can be equilibrium outcomes.",
+        "topic": "Repeated Games",
+        "difficulty": "hard",
+        "type": "conceptual"
     },
     {
         "question": "In a finitely repeated Prisoner's Dilemma with known end:",
         "options": ["Cooperation can persist", "Backward induction leads to defection", "Mixed strategies emerge", "Players randomize in every period"],
         "correct_answer": "Backward induction leads to defection",
-        "explanation": "Knowing the final round, rational players unravel to always defect."
+        "explanation": "Knowing the final round, rational players unravel to always defect.",
+        "topic": "Repeated Games",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "Trigger strategies in repeated games involve:",
         "options": ["Random retaliation", "Punishing defection by reverting to Nash", "Always cooperating", "Ignoring past play"],
         "correct_answer": "Punishing defection by reverting to Nash",
-        "explanation": "Trigger strategies enforce cooperation through credible punishment."
+        "explanation": "Trigger strategies enforce cooperation through credible punishment.",
+        "topic": "Repeated Games",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
 
     # === Bayesian Games ===
@@ -180,19 +255,28 @@ QUESTION_BANK = [
         "question": "A Bayesian game differs from a standard game because:",
         "options": ["It involves infinite players", "Payoffs are unknown", "Players have incomplete information", "Players move simultaneously"],
         "correct_answer": "Players have incomplete information",
-        "explanation": "Players have private information (types) unknown to others."
+        "explanation": "Players have private information (types) unknown to others.",
+        "topic": "Bayesian Games",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "In a Bayesian Nash equilibrium, players:",
         "options": ["Know all other players' types", "Maximize expected utility given beliefs about types", "Always reveal their types", "Use only pure strategies"],
         "correct_answer": "Maximize expected utility given beliefs about types",
-        "explanation": "Players form beliefs and best-respond in expectation."
+        "explanation": "Players form beliefs and best-respond in expectation.",
+        "topic": "Bayesian Games",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "Common knowledge in game theory means:",
         "options": ["Everyone knows something", "Everyone knows that everyone knows, ad infinitum", "Information is publicly announced", "All players are identical"],
         "correct_answer": "Everyone knows that everyone knows, ad infinitum",
-        "explanation": "Common knowledge requires infinite levels of mutual knowledge."
+        "explanation": "Common knowledge requires infinite levels of mutual knowledge.",
+        "topic": "Bayesian Games",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
 
     # === Mechanism Design ===
@@ -200,19 +284,28 @@ QUESTION_BANK = [
         "question": "Mechanism design focuses on:",
         "options": ["Predicting strategic behavior", "Designing rules to achieve desired outcomes", "Repeated game analysis", "Solving mixed strategy equilibria"],
         "correct_answer": "Designing rules to achieve desired outcomes",
-        "explanation": "Mechanism design is 'reverse game theory' - engineering games for specific goals."
+        "explanation": "Mechanism design is 'reverse game theory' - engineering games for specific goals.",
+        "topic": "Mechanism Design",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "A mechanism is incentive compatible if:",
         "options": ["All players receive equal payoffs", "Truth-telling is a dominant strategy", "The outcome is Pareto efficient", "Players can collude"],
         "correct_answer": "Truth-telling is a dominant strategy",
-        "explanation": "Incentive compatibility means honesty is optimal."
+        "explanation": "Incentive compatibility means honesty is optimal.",
+        "topic": "Mechanism Design",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "The revelation principle states that:",
         "options": ["All information must be public", "Any mechanism can be replaced by a truthful direct mechanism", "Players always lie", "Mechanisms cannot enforce honesty"],
         "correct_answer": "Any mechanism can be replaced by a truthful direct mechanism",
-        "explanation": "We can focus on truthful mechanisms without loss of generality."
+        "explanation": "We can focus on truthful mechanisms without loss of generality.",
+        "topic": "Mechanism Design",
+        "difficulty": "hard",
+        "type": "conceptual"
     },
 
     # === Prisoner's Dilemma and Coordination Games ===
@@ -220,19 +313,28 @@ QUESTION_BANK = [
         "question": "In the classic Prisoner's Dilemma, the dominant strategy for both players is to:",
         "options": ["Cooperate", "Defect", "Randomize", "Stay silent"],
         "correct_answer": "Defect",
-        "explanation": "Defection dominates cooperation, leading to a suboptimal outcome."
+        "explanation": "Defection dominates cooperation, leading to a suboptimal outcome.",
+        "topic": "Prisoner's Dilemma and Coordination",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "In a coordination game, the primary challenge is:",
         "options": ["Finding dominant strategies", "Selecting among multiple equilibria", "Avoiding dominated strategies", "Computing mixed strategies"],
         "correct_answer": "Selecting among multiple equilibria",
-        "explanation": "Coordination games often have multiple Nash equilibria."
+        "explanation": "Coordination games often have multiple Nash equilibria.",
+        "topic": "Prisoner's Dilemma and Coordination",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "The Stag Hunt game illustrates:",
         "options": ["Dominant strategy equilibrium", "Coordination problems and risk", "Zero-sum conflict", "Mechanism design"],
         "correct_answer": "Coordination problems and risk",
-        "explanation": "Players must coordinate to achieve the best outcome despite risk."
+        "explanation": "Players must coordinate to achieve the best outcome despite risk.",
+        "topic": "Prisoner's Dilemma and Coordination",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
 
     # === Pareto Efficiency ===
@@ -240,19 +342,28 @@ QUESTION_BANK = [
         "question": "An outcome is Pareto efficient if:",
         "options": ["No one can be made better off without making someone worse off", "Everyone gains equally", "Total payoff is maximized", "One player dominates"],
         "correct_answer": "No one can be made better off without making someone worse off",
-        "explanation": "Pareto efficiency means no Pareto improvements exist."
+        "explanation": "Pareto efficiency means no Pareto improvements exist.",
+        "topic": "Pareto Efficiency",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "A Nash equilibrium can be:",
         "options": ["Always Pareto efficient", "Sometimes Pareto inefficient", "Never Pareto efficient", "Only efficient in zero-sum games"],
         "correct_answer": "Sometimes Pareto inefficient",
-        "explanation": "Prisoner's Dilemma shows Nash equilibrium can be inefficient."
+        "explanation": "Prisoner's Dilemma shows Nash equilibrium can be inefficient.",
+        "topic": "Pareto Efficiency",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "Pareto dominance means:",
         "options": ["One outcome is better for all players", "One outcome is better for some, worse for none", "Total welfare is maximized", "Equilibrium exists"],
         "correct_answer": "One outcome is better for some, worse for none",
-        "explanation": "Pareto dominance requires no one worse off and someone better off."
+        "explanation": "Pareto dominance requires no one worse off and someone better off.",
+        "topic": "Pareto Efficiency",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
 
     # === Evolutionary Stable Strategies ===
@@ -260,19 +371,28 @@ QUESTION_BANK = [
         "question": "An Evolutionarily Stable Strategy (ESS) is resistant to:",
         "options": ["Rational deviations", "Invasion by mutant strategies", "Mixed strategies", "Repeated play"],
         "correct_answer": "Invasion by mutant strategies",
-        "explanation": "ESS concepts come from evolutionary biology applied to game theory."
+        "explanation": "ESS concepts come from evolutionary biology applied to game theory.",
+        "topic": "Evolutionary Stability",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "In evolutionary game theory, strategies with higher payoffs:",
         "options": ["Are eliminated", "Become less common", "Replicate more frequently", "Stay constant"],
         "correct_answer": "Replicate more frequently",
-        "explanation": "Fitness (payoff) determines reproductive success."
+        "explanation": "Fitness (payoff) determines reproductive success.",
+        "topic": "Evolutionary Stability",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "Every ESS is a:",
         "options": ["Dominant strategy", "Nash equilibrium", "Mixed strategy", "Pareto efficient outcome"],
         "correct_answer": "Nash equilibrium",
-        "explanation": "ESS is a refinement of Nash equilibrium with stability properties."
+        "explanation": "ESS is a refinement of Nash equilibrium with stability properties.",
+        "topic": "Evolutionary Stability",
+        "difficulty": "hard",
+        "type": "conceptual"
     },
 
     # === CALCULATION QUESTIONS ===
@@ -280,61 +400,91 @@ QUESTION_BANK = [
         "question": "Player A's payoffs are (3,1) for Player B's strategies (L,R). If B plays L with probability 0.6, what is A's expected payoff for strategy 1?",
         "options": ["2.2", "1.8", "2.0", "3.0"],
         "correct_answer": "2.2",
-        "explanation": "Expected payoff = 0.6(3) + 0.4(1) = 1.8 + 0.4 = 2.2"
+        "explanation": "Expected payoff = 0.6(3) + 0.4(1) = 1.8 + 0.4 = 2.2",
+        "topic": "Expected Utility",
+        "difficulty": "easy",
+        "type": "calculation"
     },
     {
         "question": "Player X earns 10 with probability 0.3, and 4 with probability 0.7. The expected payoff is:",
         "options": ["5.8", "6.2", "7.2", "4.0"],
         "correct_answer": "5.8",
-        "explanation": "Expected payoff = 0.3(10) + 0.7(4) = 3 + 2.8 = 5.8"
+        "explanation": "Expected payoff = 0.3(10) + 0.7(4) = 3 + 2.8 = 5.8",
+        "topic": "Expected Utility",
+        "difficulty": "easy",
+        "type": "calculation"
     },
     {
         "question": "If Player A is indifferent when Player B plays Left with probability p, and A's payoffs are (3,1) vs (0,2), find p. Where 3p + 0(1−p) = 1p + 2(1−p)",
         "options": ["0.4", "0.5", "0.6", "0.7"],
         "correct_answer": "0.6",
-        "explanation": "3p = p + 2(1-p) → 3p = p + 2 - 2p → 3p = 2 - p → 4p = 2 → p = 0.5... Wait: 3p = p + 2 - 2p = 2 - p → 4p = 2 → p = 0.5. Rechecking: 3p = p + 2 - 2p means 3p = 2 - p, so 4p = 2, p = 0.5. But answer is 0.6, let me verify original: If payoffs (3,1) for Left/Right top, and (0,2) for Left/Right bottom, then 3p + 1(1-p) = 0p + 2(1-p) gives 3p + 1 - p = 2 - 2p, so 2p + 1 = 2 - 2p, thus 4p = 1, p = 0.25. Using different interpretation where strategies give (3,0) vs (1,2): 3p + 0(1-p) = 1p + 2(1-p) → 3p = p + 2 - 2p → 3p = 2 - p → 4p = 2 → p = 0.5. Let me use answer: 3p = p + 2(1-p), 3p = p + 2 - 2p = 2 - p, 4p = 2, p = 0.5. Perhaps meant: 3p + 1(1-p) needs to equal something else. Using answer 0.6 as given."
+        "explanation": "3p = p + 2(1-p) → 3p = p + 2 - 2p → 3p = 2 - p → 4p = 2 → p = 0.5... Wait: 3p = p + 2 - 2p = 2 - p → 4p = 2 → p = 0.5. Rechecking: 3p = p + 2 - 2p means 3p = 2 - p, so 4p = 2, p = 0.5. But answer is 0.6, let me verify original: If payoffs (3,1) for Left/Right top, and (0,2) for Left/Right bottom, then 3p + 1(1-p) = 0p + 2(1-p) gives 3p + 1 - p = 2 - 2p, so 2p + 1 = 2 - 2p, thus 4p = 1, p = 0.25. Using different interpretation where strategies give (3,0) vs (1,2): 3p + 0(1-p) = 1p + 2(1-p) → 3p = p + 2 - 2p → 3p = 2 - p → 4p = 2 → p = 0.5. Let me use answer: 3p = p + 2(1-p), 3p = p + 2 - 2p = 2 - p, 4p = 2, p = 0.5. Perhaps meant: 3p + 1(1-p) needs to equal something else. Using answer 0.6 as given.",
+        "topic": "Mixed Strategies",
+        "difficulty": "hard",
+        "type": "calculation"
     },
     {
         "question": "In a zero-sum game, Player A's payoffs for strategies (A1, A2) are [4, -2] against B's best responses. The minimax value is:",
         "options": ["-2", "1", "2", "4"],
         "correct_answer": "1",
-        "explanation": "Minimax involves finding the maximum of minimum payoffs; with mixed strategies, the value is 1."
+        "explanation": "Minimax involves finding the maximum of minimum payoffs; with mixed strategies, the value is 1.",
+        "topic": "Minimax and Maximin",
+        "difficulty": "hard",
+        "type": "calculation"
     },
     {
         "question": "If U(A)=0.5, U(B)=0.8, and the player chooses A with probability 0.4, expected utility is:",
         "options": ["0.64", "0.66", "0.68", "0.70"],
         "correct_answer": "0.68",
-        "explanation": "Expected utility = 0.4(0.5) + 0.6(0.8) = 0.2 + 0.48 = 0.68"
+        "explanation": "Expected utility = 0.4(0.5) + 0.6(0.8) = 0.2 + 0.48 = 0.68",
+        "topic": "Expected Utility",
+        "difficulty": "medium",
+        "type": "calculation"
     },
     {
         "question": "In a 2x2 game, if Player 1 plays Up with probability 0.3 (Down with 0.7), and Player 2 plays Left with probability 0.5, and payoffs for (Up,Left)=6, what is the probability of this outcome?",
         "options": ["0.15", "0.20", "0.30", "0.35"],
         "correct_answer": "0.15",
-        "explanation": "Probability = 0.3 × 0.5 = 0.15"
+        "explanation": "Probability = 0.3 × 0.5 = 0.15",
+        "topic": "Mixed Strategies",
+        "difficulty": "easy",
+        "type": "calculation"
     },
     {
         "question": "Player chooses between gambles: G1 gives $100 (p=0.2) or $0 (p=0.8). G2 gives $30 (certain). If player is indifferent, what is their risk attitude coefficient if U(x)=x^a?",
         "options": ["Risk-neutral (a=1)", "Risk-averse (a<1)", "Risk-seeking (a>1)", "Cannot determine"],
         "correct_answer": "Risk-averse (a<1)",
-        "explanation": "Certainty equivalent $30 < expected value $20 implies... actually $20 < $30, so risk-seeking... Let me recalculate: E(G1) = 0.2(100) = 20. CE = 30 > 20, so risk-averse."
+        "explanation": "Certainty equivalent $30 < expected value $20 implies... actually $20 < $30, so risk-seeking... Let me recalculate: E(G1) = 0.2(100) = 20. CE = 30 > 20, so risk-averse.",
+        "topic": "Expected Utility",
+        "difficulty": "hard",
+        "type": "calculation"
     },
     {
         "question": "In matching pennies, both players mix 50-50 in equilibrium. If the payoff for matching is 1 and mismatching is -1, what is the expected payoff for Player 1?",
         "options": ["-1", "0", "0.5", "1"],
         "correct_answer": "0",
-        "explanation": "In a symmetric mixed equilibrium of a zero-sum game, expected payoff is 0."
+        "explanation": "In a symmetric mixed equilibrium of a zero-sum game, expected payoff is 0.",
+        "topic": "Mixed Strategies",
+        "difficulty": "medium",
+        "type": "calculation"
     },
     {
         "question": "A 3-player game has payoff vector (4,4,4) at outcome X and (6,2,5) at outcome Y. Which is Pareto efficient?",
         "options": ["Only X", "Only Y", "Both X and Y", "Neither X nor Y"],
         "correct_answer": "Both X and Y",
-        "explanation": "From X to Y: Player 1 gains, Player 2 loses, so X is efficient. From Y to X: Player 2 gains, Player 1 loses, so Y is efficient."
+        "explanation": "From X to Y: Player 1 gains, Player 2 loses, so X is efficient. From Y to X: Player 2 gains, Player 1 loses, so Y is efficient.",
+        "topic": "Pareto Efficiency",
+        "difficulty": "medium",
+        "type": "calculation"
     },
     {
         "question": "Given discount factor δ=0.9 and stage game payoff of 5 per period, what is the present value of infinite stream?",
         "options": ["45", "50", "55", "60"],
         "correct_answer": "50",
-        "explanation": "PV = payoff/(1-δ) = 5/(1-0.9) = 5/0.1 = 50"
+        "explanation": "PV = payoff/(1-δ) = 5/(1-0.9) = 5/0.1 = 50",
+        "topic": "Repeated Games",
+        "difficulty": "medium",
+        "type": "calculation"
     },
 
     # === Additional Conceptual Questions ===
@@ -342,53 +492,104 @@ QUESTION_BANK = [
         "question": "Which of the following is NOT a requirement for a game?",
         "options": ["Players", "Strategies", "Equal payoffs for all players", "Payoff functions"],
         "correct_answer": "Equal payoffs for all players",
-        "explanation": "Games can have asymmetric payoffs; equal payoffs are not required."
+        "explanation": "Games can have asymmetric payoffs; equal payoffs are not required.",
+        "topic": "Game Fundamentals",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "Sequential games are best analyzed using:",
         "options": ["Normal form representation", "Extensive form with backward induction", "Mixed strategies only", "Dominant strategy elimination"],
         "correct_answer": "Extensive form with backward induction",
-        "explanation": "Backward induction solves sequential games by working from end to start."
+        "explanation": "Backward induction solves sequential games by working from end to start.",
+        "topic": "Sequential Games",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "Subgame perfect equilibrium refines Nash equilibrium by requiring:",
         "options": ["Dominance in every subgame", "Nash equilibrium in every subgame", "Mixed strategies", "Pareto efficiency"],
         "correct_answer": "Nash equilibrium in every subgame",
-        "explanation": "SPE eliminates non-credible threats by requiring equilibrium play everywhere."
+        "explanation": "SPE eliminates non-credible threats by requiring equilibrium play everywhere.",
+        "topic": "Sequential Games",
+        "difficulty": "hard",
+        "type": "conceptual"
     },
     {
         "question": "In an auction, the winner's curse refers to:",
         "options": ["Paying more than the item's value", "Winning implies overestimating value", "Always losing money", "Underbidding"],
         "correct_answer": "Winning implies overestimating value",
-        "explanation": "Winner's curse occurs when winning signals you valued the item most, likely too high."
+        "explanation": "Winner's curse occurs when winning signals you valued the item most, likely too high.",
+        "topic": "Mechanism Design",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "The tragedy of the commons illustrates:",
         "options": ["Dominant strategy leading to inefficiency", "Coordination failure", "Mixed strategy equilibrium", "Mechanism design success"],
         "correct_answer": "Dominant strategy leading to inefficiency",
-        "explanation": "Individual rationality leads to collective overuse and inefficiency."
+        "explanation": "Individual rationality leads to collective overuse and inefficiency.",
+        "topic": "Prisoner's Dilemma and Coordination",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
     {
         "question": "In the Battle of the Sexes game, the main issue is:",
         "options": ["No Nash equilibrium exists", "Multiple equilibria require coordination", "Dominant strategies conflict", "Zero-sum competition"],
         "correct_answer": "Multiple equilibria require coordination",
-        "explanation": "Both players prefer coordinating but disagree on which equilibrium."
+        "explanation": "Both players prefer coordinating but disagree on which equilibrium.",
+        "topic": "Prisoner's Dilemma and Coordination",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "Cheap talk in games refers to:",
         "options": ["Costless, non-binding communication", "Binding contracts", "Monetary transfers", "Punishment mechanisms"],
         "correct_answer": "Costless, non-binding communication",
-        "explanation": "Cheap talk is communication without direct payoff consequences."
+        "explanation": "Cheap talk is communication without direct payoff consequences.",
+        "topic": "Prisoner's Dilemma and Coordination",
+        "difficulty": "easy",
+        "type": "conceptual"
     },
     {
         "question": "A strictly competitive game is one where:",
         "options": ["Players have identical preferences", "Players have diametrically opposed preferences", "All outcomes are Pareto efficient", "No equilibrium exists"],
         "correct_answer": "Players have diametrically opposed preferences",
-        "explanation": "Strictly competitive games (like zero-sum) have perfectly opposed interests."
+        "explanation": "Strictly competitive games (like zero-sum) have perfectly opposed interests.",
+        "topic": "Zero-Sum Games",
+        "difficulty": "medium",
+        "type": "conceptual"
     },
 ]
 
 
+# ============================================================================
+# QUESTION INDEX
+# ============================================================================
+
+DIFFICULTIES = ["easy", "medium", "hard"]
+QUESTION_TYPES = ["conceptual", "calculation"]
+SESSION_LENGTHS = ["10", "20", "30", "50", "All"]
+EXAM_SECONDS_OPTIONS = ["30", "60", "90", "120"]
+OPTION_LETTERS = "ABCD"
+AUTO_ADVANCE_MS = 1200
+
+
+def build_index(bank, field):
+    """Map each value of a metadata field to the bank ids that carry it"""
+    index = {}
+    for qid, q in enumerate(bank):
+        index.setdefault(q[field], []).append(qid)
+    return index
+
+
+# Built once at import so a filtered session never rescans the whole bank
+IDS_BY_TOPIC = build_index(QUESTION_BANK, "topic")
+IDS_BY_DIFFICULTY = build_index(QUESTION_BANK, "difficulty")
+IDS_BY_TYPE = build_index(QUESTION_BANK, "type")
+TOPICS = list(IDS_BY_TOPIC)
+
+
 # ============================================================================
 # GUI APPLICATION
 # ============================================================================
@@ -412,6 +613,27 @@ class GameTheoryQuiz:
         self.total_questions = 50
         self.answered = False
 
+        # Timing state
+        self.timer_job = None
+        self.advance_job = None
+        self.deadline = None
+        self.question_start = None
+        self.question_times = []
+        self.timeouts = 0
+
+        # Session filters (persist across restarts)
+        self.topic_vars = {topic: tk.BooleanVar(value=True) for topic in TOPICS}
+        self.difficulty_filter = tk.StringVar(value="any")
+        self.type_filter = tk.StringVar(value="any")
+        self.session_length = tk.StringVar(value=str(self.total_questions))
+        self.exam_mode = tk.BooleanVar(value=False)
+        self.exam_seconds = tk.StringVar(value="60")
+        self.auto_advance = tk.BooleanVar(value=False)
+
+        # Keyboard shortcuts are bound once and only act on the quiz screen
+        self.quiz_screen_active = False
+        self.root.bind("<Key>", self.handle_key)
+
         # Build UI
         self.build_start_screen()
 
@@ -427,14 +649,14 @@ class GameTheoryQuiz:
             text="Game Theory Quiz",
             font=("Arial", 28, "bold")
         )
-        title.pack(pady=20)
+        title.pack(pady=10)
 
         subtitle = ttk.Label(
             frame,
-            text=f"Test your knowledge with {self.total_questions} randomized questions",
+            text="Test your knowledge with randomized multiple-choice questions",
             font=("Arial", 14)
         )
-        subtitle.pack(pady=10)
+        subtitle.pack(pady=5)
 
         info = ttk.Label(
             frame,
@@ -442,7 +664,9 @@ class GameTheoryQuiz:
             font=("Arial", 12),
             justify=tk.LEFT
         )
-        info.pack(pady=20)
+        info.pack(pady=10)
+
+        self.build_filter_panel(frame)
 
         start_btn = ttk.Button(
             frame,
@@ -451,37 +675,150 @@ class GameTheoryQuiz:
             style="Accent.TButton",
             width=20
         )
-        start_btn.pack(pady=30)
+        start_btn.pack(pady=15)
 
         # Style the start button
         self.style.configure("Accent.TButton", font=("Arial", 14, "bold"))
 
+    def build_filter_panel(self, parent):
+        """Topic checkboxes plus difficulty and type selectors"""
+        topic_frame = ttk.LabelFrame(parent, text="Topics", padding="10")
+        topic_frame.pack(fill=tk.X, pady=5)
+
+        columns = 3
+        for i, topic in enumerate(TOPICS):
+            cb = ttk.Checkbutton(
+                topic_frame,
+                text=f"{topic} ({len(IDS_BY_TOPIC[topic])})",
+                variable=self.topic_vars[topic]
+            )
+            cb.grid(row=i // columns, column=i % columns, sticky=tk.W, padx=5, pady=2)
+
+        toggle_frame = ttk.Frame(parent)
+        toggle_frame.pack(pady=5)
+
+        ttk.Button(
+            toggle_frame,
+            text="Select All",
+            command=lambda: self.set_all_topics(True)
+        ).pack(side=tk.LEFT, padx=5)
+
+        ttk.Button(
+            toggle_frame,
+            text="Clear All",
+            command=lambda: self.set_all_topics(False)
+        ).pack(side=tk.LEFT, padx=5)
+
+        option_frame = ttk.Frame(parent)
+        option_frame.pack(pady=5)
+
+        ttk.Label(option_frame, text="Difficulty:", font=("Arial", 12)).pack(side=tk.LEFT, padx=5)
+        ttk.Combobox(
+            option_frame,
+            textvariable=self.difficulty_filter,
+            values=["any"] + DIFFICULTIES,
+            state="readonly",
+            width=12
+        ).pack(side=tk.LEFT, padx=5)
+
+        ttk.Label(option_frame, text="Type:", font=("Arial", 12)).pack(side=tk.LEFT, padx=5)
+        ttk.Combobox(
+            option_frame,
+            textvariable=self.type_filter,
+            values=["any"] + QUESTION_TYPES,
+            state="readonly",
+            width=12
+        ).pack(side=tk.LEFT, padx=5)
+
+        session_frame = ttk.Frame(parent)
+        session_frame.pack(pady=5)
+
+        ttk.Label(session_frame, text="Questions:", font=("Arial", 12)).pack(side=tk.LEFT, padx=5)
+        ttk.Combobox(
+            session_frame,
+            textvariable=self.session_length,
+            values=SESSION_LENGTHS,
+            state="readonly",
+            width=6
+        ).pack(side=tk.LEFT, padx=5)
+
+        ttk.Checkbutton(
+            session_frame,
+            text="Exam mode",
+            variable=self.exam_mode
+        ).pack(side=tk.LEFT, padx=(15, 5))
+
+        ttk.Label(session_frame, text="Seconds per question:", font=("Arial", 12)).pack(side=tk.LEFT, padx=5)
+        ttk.Combobox(
+            session_frame,
+            textvariable=self.exam_seconds,
+            values=EXAM_SECONDS_OPTIONS,
+            state="readonly",
+            width=6
+        ).pack(side=tk.LEFT, padx=5)
+
+        ttk.Checkbutton(
+            parent,
+            text="Auto-advance after feedback",
+            variable=self.auto_advance
+        ).pack(pady=5)
+
+    def set_all_topics(self, value):
+        """Tick or untick every topic checkbox"""
+        for var in self.topic_vars.values():
+            var.set(value)
+
+    def filtered_question_ids(self):
+        """Combine the precomputed id lists for the current filter selection"""
+        ids = []
+        for topic, var in self.topic_vars.items():
+            if var.get():
+                ids.extend(IDS_BY_TOPIC[topic])
+
+        difficulty = self.difficulty_filter.get()
+        if difficulty != "any":
+            allowed = set(IDS_BY_DIFFICULTY.get(difficulty, []))
+            ids = [qid for qid in ids if qid in allowed]
+
+        qtype = self.type_filter.get()
+        if qtype != "any":
+            allowed = set(IDS_BY_TYPE.get(qtype, []))
+            ids = [qid for qid in ids if qid in allowed]
+
+        return ids
+
     def start_quiz(self):
         """Initialize the quiz with randomized questions"""
-        # Select random questions
-        if len(QUESTION_BANK) >= self.total_questions:
-            self.questions = random.sample(QUESTION_BANK, self.total_questions)
+        ids = self.filtered_question_ids()
+        if not ids:
+            messagebox.showwarning("No Questions", "No questions match the selected topics and filters.")
+            return
+
+        # Select random questions, never repeating one within a session
+        length = self.session_length.get()
+        if length == "All":
+            self.total_questions = len(ids)
         else:
-            # If not enough questions, repeat some
-            self.questions = random.choices(QUESTION_BANK, k=self.total_questions)
+            self.total_questions = min(int(length), len(ids))
+        chosen = random.sample(ids, self.total_questions)
 
         # Randomize answer order for each question
-        for q in self.questions:
+        self.questions = []
+        for qid in chosen:
+            q = QUESTION_BANK[qid]
             options = q["options"].copy()
             random.shuffle(options)
-            q["shuffled_options"] = options
+            self.questions.append({**q, "shuffled_options": options})
 
         self.current_question_index = 0
         self.score = 0
+        self.question_times = []
+        self.timeouts = 0
         self.show_question()
 
-    def show_question(self):
-        """Display the current question"""
+    def build_quiz_screen(self):
+        """Create the question screen widgets once per session"""
         self.clear_screen()
-        self.answered = False
-        self.selected_answer.set("")
-
-        q = self.questions[self.current_question_index]
 
         # Main container
         main_frame = ttk.Frame(self.root, padding="20")
@@ -491,42 +828,46 @@ class GameTheoryQuiz:
         progress_frame = ttk.Frame(main_frame)
         progress_frame.pack(fill=tk.X, pady=(0, 10))
 
-        progress_text = ttk.Label(
+        self.progress_text = ttk.Label(
             progress_frame,
-            text=f"Question {self.current_question_index + 1} / {self.total_questions}  |  Score: {self.score}",
+            text="",
             font=("Arial", 12, "bold")
         )
-        progress_text.pack()
+        self.progress_text.pack()
 
-        progress = ttk.Progressbar(
+        self.timer_label = ttk.Label(
+            progress_frame,
+            text="",
+            font=("Arial", 12, "bold")
+        )
+        self.timer_label.pack()
+
+        self.progress = ttk.Progressbar(
             progress_frame,
             length=800,
-            mode='determinate',
-            value=(self.current_question_index / self.total_questions) * 100
+            mode='determinate'
         )
-        progress.pack(pady=5)
+        self.progress.pack(pady=5)
 
         # Question text
         question_frame = ttk.Frame(main_frame)
         question_frame.pack(fill=tk.BOTH, expand=True, pady=10)
 
-        question_label = ttk.Label(
+        self.question_label = ttk.Label(
             question_frame,
-            text=q["question"],
+            text="",
             font=("Arial", 14),
             wraplength=850,
             justify=tk.LEFT
         )
-        question_label.pack(anchor=tk.W, pady=10)
+        self.question_label.pack(anchor=tk.W, pady=10)
 
         # Answer options
         self.option_buttons = []
-        for option in q["shuffled_options"]:
+        for _ in OPTION_LETTERS:
             rb = ttk.Radiobutton(
                 question_frame,
-                text=option,
                 variable=self.selected_answer,
-                value=option,
                 style="TRadiobutton"
             )
             rb.pack(anchor=tk.W, pady=5, padx=20)
@@ -569,26 +910,103 @@ class GameTheoryQuiz:
             button_frame,
             text="Next Question",
             command=self.next_question,
-            width=20,
-            state=tk.DISABLED
+            width=20
         )
         self.next_btn.pack(side=tk.LEFT, padx=10)
 
-    def check_answer(self):
+        shortcuts = ttk.Label(
+            main_frame,
+            text="Keys: 1-4 or A-D to select  •  Enter to submit / next",
+            font=("Arial", 10),
+            foreground="gray"
+        )
+        shortcuts.pack()
+
+        self.quiz_screen_active = True
+
+    def show_question(self):
+        """Display the current question, reusing the existing quiz widgets"""
+        if not self.quiz_screen_active:
+            self.build_quiz_screen()
+
+        self.answered = False
+        self.selected_answer.set("")
+
+        q = self.questions[self.current_question_index]
+
+        self.progress_text.config(
+            text=f"Question {self.current_question_index + 1} / {self.total_questions}  |  Score: {self.score}"
+        )
+        self.progress.config(value=(self.current_question_index / self.total_questions) * 100)
+        self.timer_label.config(text="")
+        self.question_label.config(text=q["question"])
+
+        for letter, rb, option in zip(OPTION_LETTERS, self.option_buttons, q["shuffled_options"]):
+            rb.config(text=f"{letter}. {option}", value=option, state=tk.NORMAL)
+
+        self.feedback_label.config(text="")
+        self.explanation_label.config(text="")
+        self.submit_btn.config(state=tk.NORMAL)
+        self.next_btn.config(state=tk.DISABLED)
+
+        self.question_start = time.monotonic()
+        if self.exam_mode.get():
+            self.deadline = self.question_start + int(self.exam_seconds.get())
+            self.tick_timer()
+
+    def tick_timer(self):
+        """Refresh the countdown once per second and auto-submit at zero"""
+        self.timer_job = None
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            self.timer_label.config(text="Time left: 0s", foreground="red")
+            self.check_answer(timed_out=True)
+            return
+
+        seconds = math.ceil(remaining)
+        self.timer_label.config(
+            text=f"Time left: {seconds}s",
+            foreground="red" if seconds <= 10 else "black"
+        )
+        # Wake again exactly when the displayed second changes
+        delay = max(1, int((remaining - (seconds - 1)) * 1000))
+        self.timer_job = self.root.after(delay, self.tick_timer)
+
+    def cancel_advance(self):
+        """Drop any pending auto-advance callback"""
+        if self.advance_job is not None:
+            self.root.after_cancel(self.advance_job)
+            self.advance_job = None
+
+    def cancel_timer(self):
+        """Drop any pending countdown callback"""
+        if self.timer_job is not None:
+            self.root.after_cancel(self.timer_job)
+            self.timer_job = None
+
+    def check_answer(self, timed_out=False):
         """Check the selected answer and provide immediate feedback"""
         if self.answered:
             return
 
         answer = self.selected_answer.get()
-        if not answer:
+        if not answer and not timed_out:
             messagebox.showwarning("No Selection", "Please select an answer before submitting.")
             return
 
         self.answered = True
+        self.cancel_timer()
+        self.question_times.append(time.monotonic() - self.question_start)
         q = self.questions[self.current_question_index]
         correct = q["correct_answer"]
 
-        if answer == correct:
+        if timed_out and not answer:
+            self.timeouts += 1
+            self.feedback_label.config(
+                text=f"⏱ Time's up! The correct answer is: {correct}",
+                foreground="red"
+            )
+        elif answer == correct:
             self.score += 1
             self.feedback_label.config(
                 text=f"✓ Correct! The answer is: {correct}",
@@ -610,8 +1028,39 @@ class GameTheoryQuiz:
         self.submit_btn.config(state=tk.DISABLED)
         self.next_btn.config(state=tk.NORMAL)
 
+        if self.auto_advance.get():
+            self.advance_job = self.root.after(AUTO_ADVANCE_MS, self.next_question)
+
+    def handle_key(self, event):
+        """Select with 1-4 / A-D, submit or advance with Enter"""
+        if not self.quiz_screen_active:
+            return
+
+        if event.keysym in ("Return", "KP_Enter"):
+            if self.answered:
+                self.next_question()
+            else:
+                self.check_answer()
+            return "break"
+
+        key = event.char.upper()
+        if not key or self.answered:
+            return
+        if key in "1234":
+            index = int(key) - 1
+        elif key in OPTION_LETTERS:
+            index = OPTION_LETTERS.index(key)
+        else:
+            return
+
+        options = self.questions[self.current_question_index]["shuffled_options"]
+        if index < len(options):
+            self.selected_answer.set(options[index])
+        return "break"
+
     def next_question(self):
         """Move to the next question or show results"""
+        self.cancel_advance()
         self.current_question_index += 1
 
         if self.current_question_index < self.total_questions:
@@ -649,6 +1098,18 @@ class GameTheoryQuiz:
         )
         percentage_label.pack(pady=10)
 
+        if self.question_times:
+            average = sum(self.question_times) / len(self.question_times)
+            timing_text = f"Average time per question: {average:.1f}s  |  Slowest: {max(self.question_times):.1f}s"
+            if self.exam_mode.get():
+                timing_text += f"  |  Timed out: {self.timeouts}"
+            timing_label = ttk.Label(
+                frame,
+                text=timing_text,
+                font=("Arial", 12)
+            )
+            timing_label.pack(pady=5)
+
         # Performance feedback
         if percentage >= 90:
             feedback = "Excellent! You've mastered Game Theory!"
@@ -691,6 +1152,9 @@ class GameTheoryQuiz:
 
     def clear_screen(self):
         """Clear all widgets from the screen"""
+        self.cancel_timer()
+        self.cancel_advance()
+        self.quiz_screen_active = False
         for widget in self.root.winfo_children():
             widget.destroy()
 